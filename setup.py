@@ -13,8 +13,13 @@ via Py_Main. This means the actual running process IS the Transkeet binary
 permissions — Accessibility, Input Monitoring, Microphone — to the app.
 """
 
+import importlib.util
+import marshal
+import os
 import plistlib
+import struct
 import subprocess
+import sys
 import sysconfig
 import tempfile
 from pathlib import Path
@@ -25,6 +30,7 @@ APP = DIST / "Transkeet.app"
 CONTENTS = APP / "Contents"
 MACOS = CONTENTS / "MacOS"
 RESOURCES = CONTENTS / "Resources"
+BUNDLE = RESOURCES / "transkeet.bundle"
 
 INFO_PLIST = {
     "CFBundleExecutable": "Transkeet",
@@ -51,6 +57,63 @@ _py_libdir = sysconfig.get_config_var("LIBDIR")
 _py_ldlib = sysconfig.get_config_var("LDLIBRARY")  # e.g. libpython3.12.dylib
 # Extract the -l flag name: libpython3.12.dylib → python3.12
 _py_link = _py_ldlib.removeprefix("lib").removesuffix(".dylib")
+_site_packages = _venv / "lib" / f"python{sysconfig.get_python_version()}" / "site-packages"
+
+# Bytecode cache shared by the build (precompiled with -OO) and the launcher,
+# so optimized .pyc files exist for every module before the first launch.
+PYCACHE = Path.home() / "Library" / "Caches" / "Transkeet" / "pycache"
+
+# Meta path importer that serves transkeet's own modules from BUNDLE: one
+# open + mmap instead of a stat/open/read per module. Installed into
+# Resources and imported by the launcher before transkeet.app. If the bundle
+# is missing or was built by another Python, imports fall back to PYTHONPATH.
+BUNDLE_LOADER_PY = f"""\
+import importlib.util
+import marshal
+import mmap
+import struct
+import sys
+
+BUNDLE = {str(BUNDLE)!r}
+
+
+class BundleImporter:
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        (header_len,) = struct.unpack_from("<I", self._mm, 0)
+        magic, self._index = marshal.loads(self._mm[4 : 4 + header_len])
+        if magic != importlib.util.MAGIC_NUMBER:
+            raise ImportError("bundle was built by a different Python version")
+        self._base = 4 + header_len
+        size = max((off + length for off, length, _, _ in self._index.values()), default=0)
+        if self._base + size > len(self._mm):
+            raise ImportError("bundle is truncated")
+
+    def find_spec(self, fullname, path=None, target=None):
+        entry = self._index.get(fullname)
+        if entry is None:
+            return None
+        _, _, origin, search_path = entry
+        spec = importlib.util.spec_from_loader(fullname, self, origin=origin)
+        spec.has_location = True
+        spec.submodule_search_locations = search_path
+        return spec
+
+    def create_module(self, spec):
+        return None
+
+    def exec_module(self, module):
+        offset, length, _, _ = self._index[module.__spec__.name]
+        start = self._base + offset
+        exec(marshal.loads(self._mm[start : start + length]), module.__dict__)
+
+
+try:
+    sys.meta_path.insert(0, BundleImporter(BUNDLE))
+except Exception as e:  # missing, truncated or corrupt bundle
+    print(f"Transkeet: not using module bundle ({{e}})", file=sys.stderr)
+"""
 
 LAUNCHER_C = f"""\
 #include <Python.h>
@@ -75,6 +138,8 @@ int main(int argc, char *argv[]) {{
     CFDictionarySetValue(opts, kAXTrustedCheckOptionPrompt, kCFBooleanTrue);
     Boolean trusted = AXIsProcessTrustedWithOptions(opts);
     CFRelease(opts);
+    /* Tell the Python side not to repeat the check */
+    setenv("TRANSKEET_AX_CHECKED", "1", 1);
 
     if (!trusted) {{
         fprintf(stderr,
@@ -113,21 +178,50 @@ int main(int argc, char *argv[]) {{
 
     /* Point Python at the base install for stdlib, venv for packages */
     setenv("PYTHONHOME", "{_py_prefix}", 1);
-    setenv("PYTHONPATH", "{ROOT / 'src'}:{_venv / 'lib' / f'python{sysconfig.get_python_version()}' / 'site-packages'}", 1);
+    setenv("PYTHONPATH", "{RESOURCES}:{ROOT / 'src'}:{_site_packages}", 1);
     setenv("VIRTUAL_ENV", "{_venv}", 1);
+    setenv("PYTHONPYCACHEPREFIX", "{PYCACHE}", 1);
 
     /* ── Run Python inline (single process, no fork/exec) ──────────── */
     wchar_t *py_argv[] = {{
         L"transkeet",
+        L"-OO",  /* strip docstrings and asserts; matches the prebuilt .pyc */
         L"-c",
-        L"from transkeet.app import main; main()",
+        L"import transkeet_bundle; from transkeet.app import main; main()",
         NULL
     }};
-    return Py_Main(3, py_argv);
+    return Py_Main(4, py_argv);
 }}
 """
 
 
+def write_bundle():
+    """Pack transkeet's modules as marshalled -OO code objects into BUNDLE.
+
+    Layout: <u32 header length><marshal (magic, index)><code blobs>, where
+    index maps module name → (offset, length, source path, package __path__).
+    """
+    pkg = ROOT / "src" / "transkeet"
+    index = {}
+    blobs = []
+    offset = 0
+    for path in sorted(pkg.glob("*.py")):
+        is_pkg = path.stem == "__init__"
+        name = "transkeet" if is_pkg else f"transkeet.{path.stem}"
+        code = compile(path.read_bytes(), str(path), "exec", dont_inherit=True, optimize=2)
+        blob = marshal.dumps(code)
+        index[name] = (offset, len(blob), str(path), [str(pkg)] if is_pkg else None)
+        blobs.append(blob)
+        offset += len(blob)
+
+    header = marshal.dumps((importlib.util.MAGIC_NUMBER, index))
+    with open(BUNDLE, "wb") as f:
+        f.write(struct.pack("<I", len(header)))
+        f.write(header)
+        f.writelines(blobs)
+    (RESOURCES / "transkeet_bundle.py").write_text(BUNDLE_LOADER_PY)
+
+
 def build():
     # Clean previous build
     if APP.exists():
@@ -164,6 +258,29 @@ def build():
     )
     Path(c_path).unlink()
 
+    # Pack transkeet's own code into a single mmap-able module bundle
+    write_bundle()
+
+    # Precompile optimized bytecode into the launcher's pycache prefix
+    PYCACHE.mkdir(parents=True, exist_ok=True)
+    compileall = [sys.executable, "-OO", "-m", "compileall", "-q", "-j0"]
+    env = {**os.environ, "PYTHONPYCACHEPREFIX": str(PYCACHE)}
+
+    # Our own code must always compile
+    subprocess.run([*compileall, str(RESOURCES), str(ROOT / "src")], env=env, check=True)
+
+    # Stdlib and site-packages, skipping test trees (lib2to3 test data is
+    # Python 2 source and never compiles)
+    compile_dirs = [sysconfig.get_path("stdlib")]
+    if _site_packages.exists():
+        compile_dirs.append(_site_packages)
+    result = subprocess.run(
+        [*compileall, "-x", r"/(test|tests|lib2to3)/", *compile_dirs],
+        env=env,
+    )
+    if result.returncode != 0:
+        print("Warning: some third-party modules failed to precompile.")
+
     # Ad-hoc codesign so TCC has a stable identity
     subprocess.run(
         ["codesign", "--force", "--deep", "--sign", "-", str(APP)],
@@ -174,6 +291,8 @@ def build():
     print(f"  Bundle ID: {INFO_PLIST['CFBundleIdentifier']}")
     print(f"  Launcher:  {launcher_path} (compiled Mach-O, embeds Python)")
     print(f"  Info.plist: {CONTENTS / 'Info.plist'}")
+    print(f"  Bytecode:  {PYCACHE} (-OO)")
+    print(f"  Modules:   {BUNDLE} (re-run this script after editing src/)")
 
 
 if __name__ == "__main__":
@@ -1,32 +1,41 @@
+from __future__ import annotations
+
+import os
 import threading
 import time
+from typing import TYPE_CHECKING
 
-import numpy as np
 import rumps
-import sounddevice as sd
 
 from transkeet.config import build_vocabulary_replacements, ensure_config
 from transkeet.transcriber import Transcriber
 
+if TYPE_CHECKING:
+    import numpy as np
+    import sounddevice as sd
+
+# numpy and sounddevice are imported lazily (on first recording, or by the
+# background audio warm-up in run()) so the menu bar icon appears sooner.
+
 # ── Hotkey helpers ──────────────────────────────────────────────────────────
 
-# Map config names → pynput key objects
+# Map config names → pynput Key attribute names
 _MODIFIER_MAP = {
-    "cmd": "Key.cmd",
-    "command": "Key.cmd",
-    "cmd_r": "Key.cmd_r",
-    "cmd_l": "Key.cmd_l",
-    "shift": "Key.shift",
-    "shift_r": "Key.shift_r",
-    "shift_l": "Key.shift_l",
-    "ctrl": "Key.ctrl",
-    "control": "Key.ctrl",
-    "ctrl_r": "Key.ctrl_r",
-    "ctrl_l": "Key.ctrl_l",
-    "alt": "Key.alt",
-    "option": "Key.alt",
-    "alt_r": "Key.alt_r",
-    "alt_l": "Key.alt_l",
+    "cmd": "cmd",
+    "command": "cmd",
+    "cmd_r": "cmd_r",
+    "cmd_l": "cmd_l",
+    "shift": "shift",
+    "shift_r": "shift_r",
+    "shift_l": "shift_l",
+    "ctrl": "ctrl",
+    "control": "ctrl",
+    "ctrl_r": "ctrl_r",
+    "ctrl_l": "ctrl_l",
+    "alt": "alt",
+    "option": "alt",
+    "alt_r": "alt_r",
+    "alt_l": "alt_l",
 }
 
 
@@ -34,11 +43,12 @@ def _parse_hotkey(spec: str):
     """Parse a hotkey string like 'cmd+shift+space' into a pynput-compatible set."""
     from pynput.keyboard import Key, KeyCode
 
+    modifiers = {name: getattr(Key, attr) for name, attr in _MODIFIER_MAP.items()}
     parts = [p.strip().lower() for p in spec.split("+")]
     keys = set()
     for part in parts:
-        if part in _MODIFIER_MAP:
-            keys.add(getattr(Key, _MODIFIER_MAP[part].split(".")[1]))
+        if part in modifiers:
+            keys.add(modifiers[part])
         elif len(part) == 1:
             keys.add(KeyCode.from_char(part))
         else:
@@ -53,60 +63,109 @@ def _parse_hotkey(spec: str):
     return keys
 
 
+def _build_canonical_map(hotkey_keys: set) -> dict:
+    """Map side-specific keys (e.g. cmd_l) to their generic form (cmd).
+
+    Only collapses left/right variants when the hotkey uses the generic form.
+    If the hotkey contains a side-specific key like cmd_r, that exact key is
+    preserved (it is simply absent from the map).
+    """
+    from pynput.keyboard import Key
+
+    canonical = {}
+    for key in Key:
+        name = key.name
+        if name.endswith(("_l", "_r")):
+            generic = getattr(Key, name[:-2], None)
+            if generic is not None and generic in hotkey_keys:
+                canonical[key] = generic
+    return canonical
+
+
 # ── Clipboard + paste via PyObjC ────────────────────────────────────────────
 
 
+# General pasteboard and the string type, resolved on first use so AppKit
+# stays off the startup import path.
+_PASTEBOARD = None
+_PB_STRING_TYPE = None
+
+
+def _pasteboard():
+    global _PASTEBOARD, _PB_STRING_TYPE
+    if _PASTEBOARD is None:
+        from AppKit import NSPasteboard, NSPasteboardTypeString
+
+        _PB_STRING_TYPE = NSPasteboardTypeString
+        _PASTEBOARD = NSPasteboard.generalPasteboard()
+    return _PASTEBOARD
+
+
 def _get_clipboard() -> str | None:
     """Read the current clipboard string (or None)."""
-    from AppKit import NSPasteboard, NSStringPboardType
-
-    pb = NSPasteboard.generalPasteboard()
-    return pb.stringForType_(NSStringPboardType)
+    return _pasteboard().stringForType_(_PB_STRING_TYPE)
 
 
 def _set_clipboard(text: str):
     """Write a string to the clipboard."""
-    from AppKit import NSPasteboard, NSStringPboardType
-
-    pb = NSPasteboard.generalPasteboard()
+    pb = _pasteboard()
     pb.clearContents()
-    pb.setString_forType_(text, NSStringPboardType)
+    pb.setString_forType_(text, _PB_STRING_TYPE)
+
+
+# Cmd+V key-down/key-up events, created on first paste and reused after
+_PASTE_EVENTS = None
+
+
+def _paste_events():
+    global _PASTE_EVENTS
+    if _PASTE_EVENTS is None:
+        import Quartz
+
+        # Key code 9 = 'v' on macOS
+        V_KEYCODE = 9
+
+        source = Quartz.CGEventSourceCreate(Quartz.kCGEventSourceStateCombinedSessionState)
+        event_down = Quartz.CGEventCreateKeyboardEvent(source, V_KEYCODE, True)
+        Quartz.CGEventSetFlags(event_down, Quartz.kCGEventFlagMaskCommand)
+        event_up = Quartz.CGEventCreateKeyboardEvent(source, V_KEYCODE, False)
+        Quartz.CGEventSetFlags(event_up, Quartz.kCGEventFlagMaskCommand)
+        _PASTE_EVENTS = (source, event_down, event_up)
+    return _PASTE_EVENTS
 
 
 def _simulate_paste():
     """Simulate Cmd+V using Quartz CoreGraphics events."""
     import Quartz
 
-    # Key code 9 = 'v' on macOS
-    V_KEYCODE = 9
-
-    source = Quartz.CGEventSourceCreate(Quartz.kCGEventSourceStateCombinedSessionState)
+    _, event_down, event_up = _paste_events()
 
-    # Cmd down + V down
-    event_down = Quartz.CGEventCreateKeyboardEvent(source, V_KEYCODE, True)
-    Quartz.CGEventSetFlags(event_down, Quartz.kCGEventFlagMaskCommand)
-    Quartz.CGEventPost(Quartz.kCGAnnotatedSessionEventTap, event_down)
-
-    # Cmd down + V up
-    event_up = Quartz.CGEventCreateKeyboardEvent(source, V_KEYCODE, False)
-    Quartz.CGEventSetFlags(event_up, Quartz.kCGEventFlagMaskCommand)
-    Quartz.CGEventPost(Quartz.kCGAnnotatedSessionEventTap, event_up)
+    # Cmd down + V down, then Cmd down + V up.  Timestamp 0 lets the
+    # window server stamp the reused events afresh on each post.
+    for event in (event_down, event_up):
+        Quartz.CGEventSetTimestamp(event, 0)
+        Quartz.CGEventPost(Quartz.kCGAnnotatedSessionEventTap, event)
 
 
 def _paste_and_restore(text: str):
     """Copy text to clipboard, paste it, then restore previous clipboard."""
+    pb = _pasteboard()
     saved = _get_clipboard()
+    # setString_forType_ is synchronous for our process, so paste right away
     _set_clipboard(text)
-    time.sleep(0.05)
+    ours = pb.changeCount()
     _simulate_paste()
+    # The target app reads the pasteboard asynchronously and reading does not
+    # bump changeCount, so wait before restoring.  The text is already on its
+    # way at this point; this only delays the restore, not the paste.
     time.sleep(0.15)
-    # Restore
+    # Restore, unless something else was copied in the meantime
+    if pb.changeCount() != ours:
+        return
     if saved is not None:
         _set_clipboard(saved)
     else:
-        from AppKit import NSPasteboard
-
-        NSPasteboard.generalPasteboard().clearContents()
+        pb.clearContents()
 
 
 # ── Menu bar app ────────────────────────────────────────────────────────────
@@ -115,9 +174,14 @@ ICON_IDLE = "\U0001F99C"  # 🦜
 ICON_RECORDING = "\U0001F534"  # 🔴
 ICON_TRANSCRIBING = "\U0001F504"  # 🔄
 
+# Initial recording buffer size (int16 samples); the buffer doubles if a recording runs longer.
+MAX_RECORDING_SECS = 60
+
 
 def _get_input_device_name() -> str:
     """Return the name of the default input audio device."""
+    import sounddevice as sd
+
     try:
         info = sd.query_devices(kind="input")
         return info["name"]
@@ -132,21 +196,25 @@ class TranskeetApp(rumps.App):
         self._config = config
         self._transcriber = Transcriber(config["model"])
         self._recording = False
-        self._audio_frames: list[np.ndarray] = []
-        self._stream: sd.InputStream | None = None
-        self._hotkey_keys = _parse_hotkey(config["hotkey"])
-        self._pressed_keys: set = set()
+        self._audio_buf: np.ndarray | None = None
+        self._audio_bytes: memoryview | None = None  # byte view of _audio_buf
+        self._audio_pos = 0  # samples written
+        self._stream: sd.RawInputStream | None = None
+        # Set up by _start_hotkey_with_notification (pynput loads off the main thread)
+        self._hotkey_keys: set = set()
+        self._canonical_map: dict = {}
+        self._pressed_keys: set = set()  # held keys that are part of the hotkey
         self._listener = None
         self._lock = threading.Lock()
         self._hotkey_recording = False  # True when recording was started by hotkey
 
         # Menu items
         self._toggle_item = rumps.MenuItem("Start Recording", callback=self._toggle_from_menu)
-        mic_name = _get_input_device_name()
+        self._mic_item = rumps.MenuItem("Mic: …", callback=None)
         self.menu = [
             self._toggle_item,
             None,  # separator
-            rumps.MenuItem(f"Mic: {mic_name}", callback=None),
+            self._mic_item,
             rumps.MenuItem(f"Hotkey: {config['hotkey']}", callback=None),
             rumps.MenuItem(f"Model: {config['model']}", callback=None),
             None,
@@ -162,36 +230,69 @@ class TranskeetApp(rumps.App):
             else:
                 self._start_recording()
 
-    def _start_recording(self):
-        self._audio_frames = []
-        sr = self._transcriber.sample_rate
-        self._stream = sd.InputStream(
-            samplerate=sr,
+    def _alloc_audio_buf(self, samples: int, keep: int = 0):
+        """Allocate the int16 recording buffer, preserving the first `keep` samples."""
+        import numpy as np
+
+        buf = np.empty(samples, dtype=np.int16)
+        if keep:
+            buf[:keep] = self._audio_buf[:keep]
+        self._audio_buf = buf
+        self._audio_bytes = memoryview(buf).cast("B")
+
+    def _new_stream(self) -> sd.RawInputStream:
+        """Open an input stream without starting it (device setup happens here)."""
+        import sounddevice as sd
+
+        return sd.RawInputStream(
+            samplerate=self._transcriber.sample_rate,
             channels=1,
-            dtype="float32",
+            dtype="int16",  # native mic format; Transcriber converts once
             callback=self._audio_callback,
         )
-        self._stream.start()
+
+    def _close_stream(self):
+        # Clear first so _stream is None even if close() raises
+        stream, self._stream = self._stream, None
+        if stream is not None:
+            stream.close()
+
+    def _start_recording(self):
+        sr = self._transcriber.sample_rate
+        # The previous buffer may still be in use by a transcription thread
+        if self._audio_buf is None:
+            self._alloc_audio_buf(sr * MAX_RECORDING_SECS)
+        self._audio_pos = 0
+        # Normally pre-opened by run(); open now if that hasn't happened yet
+        if self._stream is None:
+            self._stream = self._new_stream()
+        try:
+            self._stream.start()
+        except Exception:
+            # Drop a dead stream (e.g. device removed) so the next press reopens
+            self._close_stream()
+            raise
         self._recording = True
         self.title = ICON_RECORDING
         self._toggle_item.title = "Stop Recording"
 
     def _stop_recording(self):
         if self._stream is not None:
-            self._stream.stop()
-            self._stream.close()
-            self._stream = None
+            self._stream.stop()  # keep it open for the next recording
         self._recording = False
         self.title = ICON_TRANSCRIBING
         self._toggle_item.title = "Start Recording"
 
         # Gather audio
-        if not self._audio_frames:
+        if not self._audio_pos:
             self.title = ICON_IDLE
             return
 
-        audio = np.concatenate(self._audio_frames, axis=0).flatten()
-        self._audio_frames = []
+        # Hand the recorded slice off as-is; a fresh buffer is used next time
+        audio = self._audio_buf[: self._audio_pos]
+        self._audio_buf = None
+        self._audio_bytes = None
+        self._audio_pos = 0
 
         # Transcribe in background thread to keep UI responsive
         threading.Thread(target=self._transcribe_and_paste, args=(audio,), daemon=True).start()
@@ -199,7 +300,15 @@ class TranskeetApp(rumps.App):
     def _audio_callback(self, indata, frames, time_info, status):
         if status:
             print(f"Audio status: {status}")
-        self._audio_frames.append(indata.copy())
+        # indata is a raw CFFI buffer of int16 samples: copy its bytes
+        # straight into the byte view of the recording buffer (one memcpy,
+        # no per-block ndarray or view).
+        pos = self._audio_pos
+        end = pos + frames
+        if end > len(self._audio_buf):
+            self._alloc_audio_buf(max(end, 2 * len(self._audio_buf)), keep=pos)
+        self._audio_bytes[2 * pos : 2 * end] = indata
+        self._audio_pos = end
 
     def _transcribe_and_paste(self, audio: np.ndarray):
         try:
@@ -208,9 +317,9 @@ class TranskeetApp(rumps.App):
             text = self._transcriber.transcribe(audio)
             elapsed = time.time() - t0
             if text:
-                vocab = build_vocabulary_replacements(ensure_config())
-                for pattern, replacement in vocab:
-                    text = pattern.sub(replacement, text)
+                pattern, lookup = build_vocabulary_replacements(ensure_config())
+                if pattern is not None:
+                    text = pattern.sub(lambda m: lookup[m.lastgroup], text)
                 print(f"Transcribed {duration:.1f}s audio in {elapsed:.2f}s: {text}")
                 _paste_and_restore(text)
             else:
@@ -228,43 +337,26 @@ class TranskeetApp(rumps.App):
     # ── Hotkey listener ─────────────────────────────────────────────────────
 
     def _start_hotkey_listener(self):
-        from pynput.keyboard import Key, KeyCode, Listener
-
-        def _canonical(key):
-            """Normalize key to match our parsed set.
-
-            Only collapses left/right variants (e.g. cmd_l → cmd) when the
-            hotkey uses the generic form.  If the hotkey contains a side-
-            specific key like cmd_r, that exact key is preserved.
-            """
-            if hasattr(key, "name"):
-                name = key.name
-                for suffix in ("_l", "_r"):
-                    if name.endswith(suffix):
-                        base = name[: -len(suffix)]
-                        try:
-                            generic = getattr(Key, base)
-                        except AttributeError:
-                            return key
-                        if generic in self._hotkey_keys:
-                            return generic
-                        return key
-                return key
-            return key
+        from pynput.keyboard import Listener
+
+        # Normalize key to match our parsed set (see _build_canonical_map)
+        _canonical = self._canonical_map.get
+
+        hotkey_len = len(self._hotkey_keys)
 
         def on_press(key):
-            self._pressed_keys.add(_canonical(key))
-            if (
-                self._hotkey_keys.issubset(self._pressed_keys)
-                and not self._recording
-            ):
+            k = _canonical(key, key)
+            if k in self._hotkey_keys:
+                self._pressed_keys.add(k)
+            if len(self._pressed_keys) == hotkey_len and not self._recording:
                 self._hotkey_recording = True
                 with self._lock:
                     self._start_recording()
 
         def on_release(key):
-            self._pressed_keys.discard(_canonical(key))
-            if self._hotkey_recording and not self._hotkey_keys.issubset(self._pressed_keys):
+            k = _canonical(key, key)
+            self._pressed_keys.discard(k)
+            if self._hotkey_recording and len(self._pressed_keys) < hotkey_len:
                 self._hotkey_recording = False
                 with self._lock:
                     if self._recording:
@@ -283,10 +375,49 @@ class TranskeetApp(rumps.App):
         except Exception as e:
             rumps.notification("Transkeet", "Model failed to load", str(e))
 
+    def _start_hotkey_with_notification(self):
+        try:
+            self._hotkey_keys = _parse_hotkey(self._config["hotkey"])
+            self._canonical_map = _build_canonical_map(self._hotkey_keys)
+            self._start_hotkey_listener()
+        except Exception as e:
+            print(f"Hotkey listener failed to start: {e}")
+            rumps.notification("Transkeet", "Hotkey unavailable", str(e))
+
+    def _load_audio_device(self):
+        """Pre-open the input stream off the main thread and show the active mic."""
+        # Import PortAudio and numpy and open the device without holding the
+        # lock, so a hotkey press meanwhile never blocks pynput's event tap
+        # callback.  The first recording buffer is allocated here too, so the
+        # first press never imports numpy inside the tap either.
+        import numpy  # noqa: F401  (first import is slow)
+
+        try:
+            stream = self._new_stream()
+        except Exception as e:
+            print(f"Could not open audio input: {e}")
+            stream = None
+        with self._lock:
+            if self._stream is None:
+                self._stream, stream = stream, None
+            if self._audio_buf is None:
+                self._alloc_audio_buf(self._transcriber.sample_rate * MAX_RECORDING_SECS)
+        if stream is not None:
+            # A recording opened its own stream first
+            stream.close()
+        self._mic_item.title = f"Mic: {_get_input_device_name()}"
+
     def run(self, **kwargs):
-        # Load model in background so the app launches fast
-        threading.Thread(target=self._load_model_with_notification, daemon=True).start()
-        self._start_hotkey_listener()
+        rumps.events.before_quit.register(self._close_stream)
+        # Load model, pre-open the audio stream and start the hotkey listener
+        # concurrently in background so the app launches fast and the hotkey
+        # can start capturing immediately.
+        for target in (
+            self._load_model_with_notification,
+            self._load_audio_device,
+            self._start_hotkey_with_notification,
+        ):
+            threading.Thread(target=target, daemon=True).start()
         super().run(**kwargs)
 
 
@@ -310,9 +441,10 @@ def _check_accessibility():
 
 
 def main():
-    # Accessibility check is handled by the native Mach-O launcher in the .app bundle.
-    # When running from terminal, check here as a fallback.
-    if not _check_accessibility():
+    # Accessibility check is handled by the native Mach-O launcher in the .app bundle
+    # (which sets TRANSKEET_AX_CHECKED).  When running from terminal, check here as a
+    # fallback.
+    if os.environ.get("TRANSKEET_AX_CHECKED") != "1" and not _check_accessibility():
         print("Tip: Launch via Transkeet.app for proper Accessibility permission handling.")
     config = ensure_config()
     print(f"Config: hotkey={config['hotkey']}, model={config['model']}")
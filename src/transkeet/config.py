@@ -34,54 +34,47 @@ DEFAULT_CONFIG_JSONC = """\
 """
 
 
-def _strip_jsonc_comments(text: str) -> str:
-    """Remove // and /* */ comments from JSONC text."""
-    # Remove single-line comments (but not inside strings)
-    result = []
-    in_string = False
-    i = 0
-    while i < len(text):
-        ch = text[i]
-        if ch == '"' and (i == 0 or text[i - 1] != "\\"):
-            in_string = not in_string
-            result.append(ch)
-            i += 1
-        elif not in_string and text[i : i + 2] == "//":
-            # Skip to end of line
-            while i < len(text) and text[i] != "\n":
-                i += 1
-        elif not in_string and text[i : i + 2] == "/*":
-            # Skip to closing */
-            i += 2
-            while i < len(text) - 1 and text[i : i + 2] != "*/":
-                i += 1
-            i += 2
-        else:
-            result.append(ch)
-            i += 1
-    return "".join(result)
-
-
-def _strip_trailing_commas(text: str) -> str:
-    """Remove trailing commas before } or ]."""
-    return re.sub(r",\s*([}\]])", r"\1", text)
+# One pass over JSONC text: string literals are matched first (group 1) so
+# their contents are kept verbatim; comments and trailing commas (a comma
+# followed only by whitespace/comments and then } or ]) are dropped.
+_JSONC_RE = re.compile(
+    r'("(?:\\.|[^"\\])*")'
+    r"|//[^\n]*"
+    r"|/\*(?:[^*]|\*(?!/))*\*/"
+    r"|,(?=(?:\s|//[^\n]*|/\*(?:[^*]|\*(?!/))*\*/)*[}\]])"
+)
+
+
+def _strip_jsonc(text: str) -> str:
+    """Remove // and /* */ comments and trailing commas from JSONC text."""
+    return _JSONC_RE.sub(lambda m: m.group(1) or "", text)
+
+
+# (st_mtime_ns, st_size) of the config file → parsed config, for this process
+_config_cache: tuple[tuple[int, int], dict] | None = None
 
 
 def ensure_config() -> dict:
     """Load config from disk, creating defaults if needed."""
+    global _config_cache
     os.makedirs(CONFIG_DIR, exist_ok=True)
-    if not os.path.exists(CONFIG_PATH):
+    try:
+        st = os.stat(CONFIG_PATH)
+    except FileNotFoundError:
         with open(CONFIG_PATH, "w") as f:
             f.write(DEFAULT_CONFIG_JSONC)
         return dict(DEFAULT_CONFIG)
 
+    # Skip parsing when the file is unchanged since the last load
+    key = (st.st_mtime_ns, st.st_size)
+    if _config_cache is not None and _config_cache[0] == key:
+        return dict(_config_cache[1])
+
     with open(CONFIG_PATH) as f:
         raw = f.read()
 
-    stripped = _strip_jsonc_comments(raw)
-    stripped = _strip_trailing_commas(stripped)
     try:
-        user_cfg = json.loads(stripped)
+        user_cfg = json.loads(_strip_jsonc(raw))
     except json.JSONDecodeError as e:
         print(f"Warning: failed to parse {CONFIG_PATH}: {e}")
         print("Using default config.")
@@ -89,25 +82,36 @@ def ensure_config() -> dict:
 
     merged = dict(DEFAULT_CONFIG)
     merged.update(user_cfg)
-    return merged
+    _config_cache = (key, merged)
+    return dict(merged)
 
 
-def build_vocabulary_replacements(config: dict) -> list[tuple[re.Pattern, str]]:
-    """Build regex replacements from the vocabulary config.
+def build_vocabulary_replacements(config: dict) -> tuple[re.Pattern | None, dict[str, str]]:
+    """Build a single regex that applies all vocabulary replacements in one pass.
 
-    Returns a list of (compiled_pattern, replacement_name) tuples,
-    sorted longest-match-first so e.g. "raj prit" matches before "raj".
+    Returns (compiled_pattern, lookup) where each variant is a named group
+    g0, g1, ... and lookup maps group name → replacement name. Use as
+    ``pattern.sub(lambda m: lookup[m.lastgroup], text)``. The pattern is
+    None when there is no vocabulary.
+
+    Variants are ordered longest-first so e.g. "raj prit" matches before "raj".
     """
     pairs: list[tuple[str, str]] = []
     for entry in config.get("vocabulary", []):
         name = entry.get("name", "")
         for variant in entry.get("sounds_like", []):
-            pairs.append((variant, name))
+            if variant:
+                pairs.append((variant, name))
+
+    if not pairs:
+        return None, {}
 
     # Sort longest first so longer phrases match before shorter substrings
     pairs.sort(key=lambda p: len(p[0]), reverse=True)
 
-    return [
-        (re.compile(r"\b" + re.escape(variant) + r"\b", re.IGNORECASE), name)
-        for variant, name in pairs
-    ]
+    alternatives = "|".join(
+        f"(?P<g{i}>{re.escape(variant)})" for i, (variant, _) in enumerate(pairs)
+    )
+    pattern = re.compile(r"\b(?:" + alternatives + r")\b", re.IGNORECASE)
+    lookup = {f"g{i}": name for i, (_, name) in enumerate(pairs)}
+    return pattern, lookup
@@ -1,9 +1,15 @@
+from __future__ import annotations
+
 import os
 import tempfile
 import wave
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
 
-import mlx.core as mx
-import numpy as np
+# numpy and mlx are imported inside the methods that need them so importing
+# this module (and therefore transkeet.app) stays cheap at startup.
 
 
 class Transcriber:
@@ -12,6 +18,7 @@ class Transcriber:
     def __init__(self, model_id: str):
         self._model_id = model_id
         self._model = None
+        self._get_logmel = None  # set by load() when in-memory input is supported
 
     def load(self):
         """Load the model (call once at startup or on first use)."""
@@ -23,49 +30,117 @@ class Transcriber:
         self._model = from_pretrained(self._model_id)
         print("Model loaded.")
 
+        # Feed audio to the model in memory when this parakeet-mlx exposes
+        # the log-mel + generate() path and the model expects our sample rate
+        # (the in-memory path does not resample).  Otherwise fall back to a
+        # temp WAV, which parakeet-mlx resamples via ffmpeg when loading.
+        preprocessor = getattr(self._model, "preprocessor_config", None)
+        if (
+            hasattr(self._model, "generate")
+            and getattr(preprocessor, "sample_rate", None) == self.sample_rate
+        ):
+            try:
+                from parakeet_mlx.audio import get_logmel
+            except ImportError:
+                pass
+            else:
+                self._get_logmel = get_logmel
+
     @property
     def sample_rate(self) -> int:
         """Expected sample rate for the model (always 16000)."""
         return 16000
 
     def transcribe(self, audio: np.ndarray) -> str:
-        """Transcribe a 1-D float32 numpy array of audio samples at 16kHz.
+        """Transcribe a 1-D numpy array of audio samples at 16kHz.
+
+        Accepts int16 PCM or float32 in [-1.0, 1.0].  Samples are converted
+        once, at the model boundary; only the WAV fallback writes int16 input
+        unchanged.
 
         Returns the transcribed text (empty string if nothing detected).
         """
+        import mlx.core as mx
+        import numpy as np
+
         if self._model is None:
             self.load()
 
         if audio.ndim != 1:
             raise ValueError(f"Expected 1-D audio array, got shape {audio.shape}")
 
-        # Ensure float32
-        if audio.dtype != np.float32:
+        # Ensure int16 or float32
+        if audio.dtype != np.int16 and audio.dtype != np.float32:
             audio = audio.astype(np.float32)
 
         # Skip very short audio (< 0.3s)
         if len(audio) < self.sample_rate * 0.3:
             return ""
 
-        # parakeet-mlx transcribe() expects a file path, so write a temp WAV
+        try:
+            if self._get_logmel is not None:
+                result = self._transcribe_array(audio)
+            else:
+                result = self._transcribe_file(audio)
+            return result.text.strip()
+        finally:
+            mx.clear_cache()
+
+    def _transcribe_array(self, audio: np.ndarray):
+        """Run the model directly on in-memory samples (no temp file).
+
+        Mirrors what parakeet-mlx's transcribe() does after loading a file:
+        compute the log-mel spectrogram and decode it.
+        """
+        import mlx.core as mx
+
+        samples = mx.array(audio)
+        if samples.dtype == mx.int16:
+            # Same scaling parakeet-mlx applies when it loads a WAV file
+            samples = samples.astype(mx.float32) / 32768.0
+        samples = samples.astype(mx.bfloat16)
+        mel = self._get_logmel(samples, self._model.preprocessor_config)
+        return self._model.generate(mel)[0]
+
+    def _transcribe_file(self, audio: np.ndarray):
+        """Fallback for parakeet-mlx versions that only accept a file path."""
         tmp_path = None
         try:
             fd, tmp_path = tempfile.mkstemp(suffix=".wav")
             os.close(fd)
             self._write_wav(tmp_path, audio)
-            result = self._model.transcribe(tmp_path)
-            return result.text.strip()
+            return self._model.transcribe(tmp_path)
         finally:
-            mx.clear_cache()
-            if tmp_path and os.path.exists(tmp_path):
-                os.unlink(tmp_path)
+            if tmp_path:
+                try:
+                    os.unlink(tmp_path)
+                except FileNotFoundError:
+                    pass
 
     def _write_wav(self, path: str, audio: np.ndarray):
-        """Write float32 mono audio to a 16-bit PCM WAV file."""
-        # Convert float32 [-1.0, 1.0] → int16
-        pcm = (audio * 32767).clip(-32768, 32767).astype(np.int16)
+        """Write int16 or float32 mono audio to a 16-bit PCM WAV file."""
+        import numpy as np
+
+        n = len(audio)
+        pcm = audio if audio.dtype == np.int16 else self._to_pcm16(audio)
+
         with wave.open(path, "wb") as wf:
             wf.setnchannels(1)
             wf.setsampwidth(2)  # 16-bit
             wf.setframerate(self.sample_rate)
-            wf.writeframes(pcm.tobytes())
+            wf.setnframes(n)  # header is final, no patch on close
+            wf.writeframesraw(pcm)
+
+    def _to_pcm16(self, audio: np.ndarray) -> np.ndarray:
+        """Convert float32 [-1.0, 1.0] → int16 with one scratch buffer."""
+        import numpy as np
+
+        # Per-call buffers: transcriptions can run concurrently on several threads
+        scaled = np.empty(audio.shape, dtype=np.float32)
+        pcm = np.empty(audio.shape, dtype=np.int16)
+
+        np.multiply(audio, 32767.0, out=scaled)
+        np.clip(scaled, -32768, 32767, out=scaled)
+        np.rint(scaled, out=scaled)
+        np.copyto(pcm, scaled, casting="unsafe")
+        return pcm